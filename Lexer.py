@@ -2,6 +2,7 @@
 # =======================================================================================#
 
 import re
+import string
 import Logic
 
 # =======================================================================================#
@@ -10,19 +11,35 @@ import Logic
 # Constants #
 # =======================================================================================#
 
-FORMS = re.compile(r'''^
-    (?P<Conjunction>[*&∧])|
-    (?P<Disjunction>[+∨])|
-    (?P<Implication>[→>])|
-    (?P<Biconditional>[↔=])|
-    (?P<Negation>[¬~])|
-    (?P<Quantifier>[∀Ǝ][a-z]+)|
-    (?P<LP>\()|
-    (?P<RP>\))|
-    (?P<Function>^[A-Z]\((,*\s*[a-z])*?\))|
-    (?P<Predicate>[a-z])|
-    (?P<Boolean>({})|({}))
-    '''.format(*Logic.BIN_VALS.keys()), re.VERBOSE)
+# the alternatives are tried left to right, so the most common tokens come first
+FORMS = re.compile(
+    r'(?P<Predicate>[a-z])|'
+    r'(?P<LP>\()|'
+    r'(?P<RP>\))|'
+    r'(?P<Negation>[¬~])|'
+    r'(?P<Conjunction>[*&∧])|'
+    r'(?P<Disjunction>[+∨])|'
+    r'(?P<Implication>[→>])|'
+    r'(?P<Biconditional>[↔=])|'
+    r'(?P<Boolean>({})|({}))|'
+    r'(?P<Function>[A-Z]\((,*\s*[a-z])*?\))|'
+    r'(?P<Quantifier>[∀Ǝ][a-z]+)'.format(*Logic.BIN_VALS.keys()))
+
+# whitespace characters removed from statements before tokenizing
+WHITESPACE = ' \t\n\r'
+WHITESPACE_TABLE = str.maketrans('', '', WHITESPACE)
+
+# tokens that are always a single character, looked up before trying FORMS
+SINGLE_FORMS = {
+    **{c: 'Predicate' for c in string.ascii_lowercase},
+    **{c: 'Conjunction' for c in '*&∧'},
+    **{c: 'Disjunction' for c in '+∨'},
+    **{c: 'Implication' for c in '→>'},
+    **{c: 'Biconditional' for c in '↔='},
+    **{c: 'Negation' for c in '¬~'},
+    '(': 'LP',
+    ')': 'RP'
+}
 
 # =======================================================================================#
 
@@ -35,24 +52,33 @@ def tokenize(statement):
     Breaks up the given logical statement into individual tokens for parsing
     """
     tokens = []
-    # remove whitespace from the statement
-    partial = statement.replace(' ', '')
-    while len(partial) > 0:
-        # compare to regex
-        m = re.match(FORMS, partial)
-        # if there is a match
-        if m:
-            # add the token and the match type to the token list
-            tokens.append((m.group(0), m.lastgroup))
-            # reduce the statement by the length of the token
-            partial = partial[m.end():]
-        else:
-            # if there is no match, raise an error
-            error_string = 'Expected a token but found {}'.format(partial)
-            raise SyntaxError(error_string)
+    append = tokens.append
+    # remove whitespace from the statement, leaving it be if there is none
+    partial = statement
+    if any(c in statement for c in WHITESPACE):
+        partial = statement.translate(WHITESPACE_TABLE)
+    pos = lp = rp = 0
+    while pos < len(partial):
+        # look single character tokens up directly
+        token = partial[pos]
+        kind = SINGLE_FORMS.get(token)
+        if kind is None:
+            # otherwise compare to regex
+            m = FORMS.match(partial, pos)
+            if not m:
+                # if there is no match, raise an error
+                error_string = 'Expected a token but found {}'.format(partial[pos:])
+                raise SyntaxError(error_string)
+            token, kind = m.group(0), m.lastgroup
+        # add the token and the match type to the token list
+        append((token, kind))
+        # count the parenthesis as they go by
+        if kind == 'LP':
+            lp += 1
+        elif kind == 'RP':
+            rp += 1
+        pos += len(token)
     # check for balanced parenthesis
-    lp = len([_ for _ in tokens if _[1] == 'LP'])
-    rp = len([_ for _ in tokens if _[1] == 'RP'])
     if lp != rp:
         raise SyntaxError('Unbalanced parenthesis error')
     return tokens
@@ -94,6 +120,15 @@ class Parser:
         'Disjunction': Logic.disjunction,
         'Implication': Logic.implication
     }
+    # binary operators with their precedence, term operators binding tighter
+    BINARY_DICT = {
+        **{k: (f, 2) for k, f in TERM_DICT.items()},
+        **{k: (f, 1) for k, f in EXPR_DICT.items()}
+    }
+    # negation only applies to the following fact, so it binds tightest
+    NEGATION = (Logic.negation, 3)
+
+    __slots__ = ('tokens', 'index', 'current_token', 'atoms')
 
     def __init__(self, statement):
         self.tokens = tokenize(statement)  # initialize the parser
@@ -125,59 +160,74 @@ class Parser:
         # return the atom
         return _atom
 
-    def fact(self):
-        # grab the current token
-        tok = self.current_token
-        # check whether it is an open parenthesis
-        if tok[1] == 'LP':
-            # grab the expression in the parenthesis
-            self.next_token()
-            _expression = self.expr()
-            # if the parenthesis is properly closed
-            if self.current_token[1] == 'RP':
+    def expr(self):
+        """
+        Parses the grammar above without recursion, keeping the pending
+        operands and operators on stacks (shunting-yard)
+        Operators of equal precedence group to the right, as in the grammar
+        """
+        operands = []
+        operators = []  # (function, precedence) pairs, None for a parenthesis
+        depth = 0  # number of parenthesis currently open
+        # bound locally, as they are looked up for every token
+        binary, negation, tokens = self.BINARY_DICT, self.NEGATION, self.tokens
+
+        def reduce(precedence):
+            # apply the stacked operators binding tighter than the precedence
+            while operators and operators[-1] is not None and operators[-1][1] > precedence:
+                func = operators.pop()[0]
+                if func == negation[0]:
+                    operands.append((func, [operands.pop()]))
+                else:
+                    rhs = operands.pop()
+                    operands.append((func, [operands.pop(), rhs]))
+
+        expect_fact = True
+        while self.index < len(tokens):
+            tok = self.current_token
+            if expect_fact:
+                # open a parenthesis or stack a negation until its fact is parsed
+                if tok[1] == 'LP':
+                    operators.append(None)
+                    depth += 1
+                elif tok[1] == 'Negation':
+                    operators.append(negation)
+                # There should be no free floating right parenthesis
+                elif tok[1] == 'RP':
+                    raise SyntaxError('Parenthesis error at {}'.format(self.index))
+                elif tok[1] in binary:
+                    raise SyntaxError('Expected an atom but found {}'.format(tok[0]))
+                # if it is not a factor, then it must be an atom
+                else:
+                    operands.append(self.atom())
+                    expect_fact = False
+                    continue
                 self.next_token()
-                # return the expression as a whole
-                return _expression
-            raise SyntaxError('Parenthesis error at {}'.format(self.index))
-        # if the parenthesis is a closure
-        elif tok[1] == 'RP':
-            # There should be no free floating right parenthesis
+            elif tok[1] in binary:
+                # finish the operators binding tighter before stacking this one
+                func, precedence = binary[tok[1]]
+                reduce(precedence)
+                operators.append((func, precedence))
+                expect_fact = True
+                self.next_token()
+            elif tok[1] == 'RP' and depth > 0:
+                # close the parenthesis, the enclosed expression is a fact
+                reduce(0)
+                operators.pop()
+                depth -= 1
+                self.next_token()
+            elif depth > 0:
+                # an open parenthesis must be properly closed
+                raise SyntaxError('Parenthesis error at {}'.format(self.index))
+            else:
+                # anything else past a complete expression is left unparsed
+                break
+
+        if expect_fact:
+            raise SyntaxError('Unexpected end of statement')
+        if depth > 0:
             raise SyntaxError('Parenthesis error at {}'.format(self.index))
-        # if the factor is a negation
-        elif tok[1] == 'Negation':
-            # increment the token
-            self.next_token()
-            # return negation function with its argument
-            return Logic.negation, [self.fact()]
-        # if it is not a factor, then it must be an atom
-        else:
-            return self.atom()
-
-    def term(self):
-        # grab the current token
-        tok = self.current_token
-        # grab the left hand side of the term
-        _term = self.fact()
-        # grab the new current token
-        tok = self.current_token
-        # check the operator between the left and right hand side
-        if tok[1] in self.TERM_DICT.keys():
-            # increment the token
-            self.next_token()
-            # return the operator and the left and right hand sides of the term
-            return self.TERM_DICT[tok[1]], [_term, self.term()]
-        else:
-            return _term
-
-    def expr(self):
-        # code follows same logic as the term() function
-        tok = self.current_token
-        _expr = self.term()
-        tok = self.current_token
-        if tok[1] in self.EXPR_DICT.keys():
-            self.next_token()
-            return self.EXPR_DICT[tok[1]], [_expr, self.expr()]
-        else:
-            return _expr
+        reduce(0)
+        return operands[0]
 
 # =======================================================================================#
@@ -2,7 +2,9 @@
 # =============================================================================#
 
 import typing
+import functools
 import itertools
+import collections
 
 import Lexer
 import Logic
@@ -13,6 +15,32 @@ import Logic
 # Constants #
 # =============================================================================#
 
+# bitwise counterparts of the logical functions, applied to whole truth table
+# columns at once (full is the column of all True evaluations)
+BIT_OPS = {
+    Logic.negation: lambda full, p: full ^ p,
+    Logic.conjunction: lambda full, p, q: p & q,
+    Logic.disjunction: lambda full, p, q: p | q,
+    Logic.implication: lambda full, p, q: (full ^ p) | q,
+    Logic.biconditional: lambda full, p, q: full ^ p ^ q
+}
+
+# atom counts above which tautology / contradiction tests try the all False and
+# all True inputs before building the whole truth table
+PROBE_ATOMS = 6
+
+# source templates inlining the logical functions into compiled statements
+SOURCE_OPS = {
+    Logic.negation: '(not {})',
+    Logic.conjunction: '({} and {})',
+    Logic.disjunction: '({} or {})',
+    Logic.implication: '((not {}) or {})',
+    Logic.biconditional: '((not {}) == (not {}))'
+}
+
+# number of compiled statements kept for reuse across WFFs
+COMPILE_CACHE = 4096
+
 # =============================================================================#
 
 
@@ -20,99 +48,331 @@ import Logic
 # =============================================================================#
 
 def derivative(arguments: list) -> typing.ClassVar:
-    
-    return WFF('({})'.format(')&('.join([str(arg) for arg in arguments])))
+
+    statement = '({})'.format(')&('.join([str(arg) for arg in arguments]))
+    if not arguments:
+        return WFF(statement)
+
+    # join the arguments' asts directly rather than parsing the statement
+    arguments = [arg if isinstance(arg, WFF) else WFF(str(arg)) for arg in arguments]
+    ast = arguments[-1].ast
+    for arg in reversed(arguments[:-1]):
+        ast = (Logic.conjunction, [arg.ast, ast])
+    atoms = []
+    for arg in arguments:
+        atoms.extend(k for k in arg.atoms if k not in atoms)
+
+    return WFF._from_ast(ast, atoms, statement)
     
 
-def simplify(new_terms: list) -> list:
+@functools.lru_cache(maxsize=4096)
+def _parse(statement: str) -> tuple:
+    """
+    Parses the statement, sharing the result across WFFs of the same statement
+    (the ast is only ever read, the atoms are returned as a tuple)
+    """
+    ast, atoms = Lexer.parse(statement)
+    return ast, tuple(atoms)
+
+
+# compiled functions by statement and atoms, least recently used first
+_compile_cache = collections.OrderedDict()
+
+
+def _compile(statement: str, ast, atoms: list) -> typing.Callable:
+    """
+    Returns the compiled function of the statement, sharing it across WFFs
+    of the same statement and atoms
+    """
+    key = (statement, tuple(atoms))
+    if key in _compile_cache:
+        _compile_cache.move_to_end(key)
+    else:
+        _compile_cache[key] = _build(ast, atoms)
+        if len(_compile_cache) > COMPILE_CACHE:
+            _compile_cache.popitem(last=False)
+    return _compile_cache[key]
+
+
+def _build(ast, atoms: list) -> typing.Callable:
+    """
+    Compiles the ast into a function of its atoms' values,
+    given positionally in the order of the atoms
+    """
+    index = {k: i for i, k in enumerate(atoms)}
+    names = {}
+    bin_vals = Logic.BIN_VALS
+
+    # build the source of a single expression, inlining the logical functions
+    # and calling any others by name
+    def leaf_source(node) -> str:
+        if node in bin_vals:
+            return node
+        return '_{}'.format(index[node])
+
+    def node_source(func, args: list) -> str:
+        if func in SOURCE_OPS:
+            return SOURCE_OPS[func].format(*args)
+        name = names.setdefault(func, '_f{}'.format(len(names)))
+        return '{}({})'.format(name, ', '.join(args))
+
+    try:
+        code = 'lambda {}: bool({})'.format(', '.join(['_{}'.format(i) for i in range(len(atoms))]),
+                                            _fold(ast, leaf_source, node_source))
+        return eval(code, {v: k for k, v in names.items()})
+    except (KeyError, SyntaxError, RecursionError, MemoryError):
+        # statements nested too deeply to compile fall back to walking the ast
+        # (CPython's parser runs out of memory on a couple hundred levels)
+        pass
+
+    # evaluate the ast, substituting atoms with given values
+    def evaluate(*vals: bool) -> bool:
+        return _fold(ast,
+                     lambda k: bin_vals[k] if k in bin_vals else vals[index[k]],
+                     lambda func, args: func(*args))
+
+    return evaluate
+
+
+def _fold(ast, leaf: typing.Callable, node: typing.Callable) -> typing.Any:
+    """
+    Evaluates the ast bottom up with an explicit stack instead of recursion,
+    so statements of any depth can be walked
+    leaf(atom)        : the value of an atom or boolean
+    node(func, args)  : the value of a function applied to its arguments' values
+    """
+    values = []
+    stack = [(ast, False)]
+    # bound locally, as they are called for every node
+    push, pop = values.append, stack.pop
+    while stack:
+        _node, ready = pop()
+        if not isinstance(_node, tuple):
+            push(leaf(_node))
+        elif ready:
+            # the arguments' values are the last ones computed
+            count = len(_node[1])
+            args = values[len(values) - count:]
+            del values[len(values) - count:]
+            push(node(_node[0], args))
+        else:
+            # come back to the function once its arguments are evaluated
+            stack.append((_node, True))
+            stack.extend([(arg, False) for arg in reversed(_node[1])])
+    return values[0]
 
-    def reduce(term, elements):
-        for elem in elements:
-            if elem in term:
-                del term[elem]
-                
-    terms = []
-    iter_count = 0
-
-    # loop until no more simplifications are possible
-    while new_terms != terms:
-        
-        terms = new_terms[:]
-        
-        # loop through term combinations looking for simplifications
-        for i, term1 in enumerate(terms[:-1]):
-            
-            # skip it if the term is empty
-            if len(term1) == 0:
-                continue
-                
-            for j, term2 in enumerate(terms[i + 1:]):
-
-                # skip it if the term is empty
-                if len(term2) == 0:
-                    continue
-                
-                # get all possible atoms across both terms
-                keys = set().union(*term1, *term2)
-
-                common_factors = []
-                uncommon_factors = []
-                unbalanced_factors = []
-
-                # determine which bin each key belongs in
-                for key in keys:
-                    if key in term1 and key in term2:
-                        if term1[key] == term2[key]:
-                            common_factors.append(key)
-                        else:
-                            uncommon_factors.append(key)
-                    else:
-                        unbalanced_factors.append(key)
-
-                # based on factors, determine what can be eliminated
-                lc = len(common_factors)
-                lu = len(uncommon_factors)
-                lb = len(unbalanced_factors)
-
-                # move on if terms begin to deviate
-                # (2 uncommon factors or more is irreducible)
-                if lu > 1:
-                    pass
-                elif len(keys) == lc:
-                    # Equality: a + a ==> a + {}
-                    new_terms[i+1+j].clear()
-                elif lu == 1 and lb == 0:
-                    if lc > 0:
-                        # Adjacency: abc + a~bc ==> ac + {}
-                        reduce(new_terms[i], uncommon_factors)
-                    else:
-                        # Cancellation: a + ~a ==> {} + {}
-                        new_terms[i].clear()
-                    new_terms[i+1+j].clear()
-                elif lc > 0 and lu == 0 and lb > 0:
-                    # Absorption: abc + ab ==> ab + {}
-                    if all(x in term1 for x in unbalanced_factors):
-                        new_terms[i].clear()
-                    elif all(x in term2 for x in unbalanced_factors):
-                        new_terms[i+1+j].clear()
-                elif lu == 1 and lb > 0:
-                    # Reduction: ab + a~bc ==> ab + ac
-                    if all(x in term1 for x in unbalanced_factors):
-                        reduce(new_terms[i], uncommon_factors)
-                    elif all(x in term2 for x in unbalanced_factors):
-                        reduce(new_terms[i+1+j], uncommon_factors)
-
-        # remove the empty terms
-        while {} in new_terms:
-            new_terms.remove({})
-            
-        iter_count += 1
-        if iter_count > 10:
-            print('Failed to simplify. Exceeded iteration threshold.')
-            break
+
+def simplify(new_terms: list) -> list:
+    """
+    Reduces a list of terms (atom/value dictionaries) in place to a
+    minimal list of terms covering the same assignments
+    """
+
+    # index the atoms across all terms in order of appearance
+    index = {}
+    for term in new_terms:
+        for k in term:
+            index.setdefault(k, len(index))
+    atoms = [*index]
+    n = len(atoms)
+
+    # encode each term as (mask, values) bits and pack the assignments
+    # covered by the terms into a bitmap
+    bits = 0
+    for term in new_terms:
+        mask = values = 0
+        for k, v in term.items():
+            mask |= 1 << index[k]
+            if v:
+                values |= 1 << index[k]
+        bits |= _cube(mask, values, n)
+
+    # unpack the minimized cubes back into terms
+    new_terms[:] = [{k: bool(values >> i & 1)
+                     for i, k in enumerate(atoms) if mask >> i & 1}
+                    for mask, values in _minimize(bits, n)]
 
     return new_terms
 
+
+def _column(i: int, n: int) -> int:
+    """
+    Returns the bitmap of the 2^n assignments in which atom i is True
+    (assignment k sets atom i to bit i of k)
+    """
+    width = 1 << i
+    # a block of 2^i zeros followed by 2^i ones, repeated across the bitmap
+    bits = ((1 << width) - 1) << width
+    return _repeat(bits, i + 1, n)
+
+
+@functools.lru_cache(maxsize=32)
+def _columns(n: int) -> tuple:
+    """
+    Returns the columns of every atom for n atoms, shared by all WFFs
+    of the same number of atoms
+    """
+    return tuple(_column(i, n) for i in range(n))
+
+
+def _repeat(bits: int, n: int, m: int) -> int:
+    """
+    Extends a bitmap over n atoms to m atoms, where the m - n new atoms
+    follow the others and do not affect any evaluation
+    """
+    # double the bitmap up to its new width, as big int division is quadratic
+    for i in range(n, m):
+        bits |= bits << (1 << i)
+    return bits
+
+
+def _cube(mask: int, values: int, n: int) -> int:
+    """
+    Returns the bitmap of assignments covered by a cube
+    mask bit i set   : atom i appears in the term
+    values bit i set : atom i appears un-negated
+    """
+    bits = 1 << (values & mask)
+    # spread the cube across every atom it does not mention
+    for i in range(n):
+        if not mask >> i & 1:
+            bits |= bits << (1 << i)
+    return bits
+
+
+def _minimize(bits: int, n: int) -> list:
+    """
+    Returns a minimal list of (mask, values) cubes covering the bitmap
+
+    Prime implicants are generated bit-slice style (DenseQMC): implicants[s]
+    has bit m set when the cube anchored at m with the atoms in s left free
+    lies entirely inside the bitmap.
+    """
+
+    full = (1 << (1 << n)) - 1
+    # nothing to combine for a constant or a single assignment
+    if bits == full:
+        return [(0, 0)]
+    if bits & (bits - 1) == 0:
+        return [((1 << n) - 1, bits.bit_length() - 1)] if bits else []
+
+    zeros = [full ^ column for column in _columns(n)]
+
+    # combine implicants across one more free atom at a time, only
+    # extending the free atom sets that still have implicants
+    implicants = {0: bits} if bits else {}
+    level = [*implicants]
+    while level:
+        next_level = []
+        for s in level:
+            prev = implicants[s]
+            for i in range(s.bit_length(), n):
+                combined = prev & (prev >> (1 << i)) & zeros[i]
+                if combined:
+                    implicants[s | (1 << i)] = combined
+                    next_level.append(s | (1 << i))
+        level = next_level
+
+    # implicants not absorbed into a larger cube are prime
+    primes = []
+    for s, imp in implicants.items():
+        for i in range(n):
+            if not s >> i & 1:
+                larger = implicants.get(s | (1 << i), 0)
+                imp &= ~(larger | (larger << (1 << i)))
+        while imp:
+            m = imp & -imp
+            primes.append((s, m.bit_length() - 1))
+            imp ^= m
+
+    mask_all = (1 << n) - 1
+    covers = [(mask_all ^ s, m, _cube(mask_all ^ s, m, n)) for s, m in primes]
+
+    # essential primes are the only cover of some assignment
+    once = twice = 0
+    for _, _, cover in covers:
+        twice |= once & cover
+        once |= cover
+    unique = once & ~twice
+    chosen = [c for c in covers if c[2] & unique]
+    remaining = bits
+    for c in chosen:
+        remaining &= ~c[2]
+
+    # greedily cover what is left, preferring the fewest literals
+    while remaining:
+        best = max(covers, key=lambda c: (bin(c[2] & remaining).count('1'),
+                                          -bin(c[0]).count('1')))
+        chosen.append(best)
+        remaining &= ~best[2]
+
+    # order the terms like the rows of the truth table
+    def order(c):
+        return [2 if not c[0] >> i & 1 else 0 if c[1] >> i & 1 else 1
+                for i in range(n)]
+
+    return [(mask, values) for mask, values, _ in sorted(chosen, key=order)]
+
+# =============================================================================#
+
+
+# Truth Table Class #
+# =============================================================================#
+
+class TruthTable(object):
+    """
+    A truth table packed into a bitmap (see WFF._truth_bits) that produces
+    its (inputs, evaluation) rows on demand instead of storing them
+    """
+
+    __slots__ = ('atoms', 'bits')
+
+    def __init__(self, atoms: list, bits: int) -> None:
+        self.atoms = tuple(atoms)
+        self.bits = bits
+
+    @classmethod
+    def from_rows(cls, rows: list) -> 'TruthTable':
+        """
+        Packs a list of (inputs, evaluation) rows into a truth table
+        """
+        atoms = [*rows[0][0]]
+        bits = sum(1 << sum(1 << i for i, k in enumerate(atoms) if row[0][k])
+                   for row in rows if row[1])
+        return cls(atoms, bits)
+
+    def _row(self, vals: tuple) -> tuple:
+        # look up the evaluation of the inputs in the bitmap
+        k = sum(1 << i for i, v in enumerate(vals) if v)
+        return dict(zip(self.atoms, vals)), bool(self.bits >> k & 1)
+
+    def __len__(self) -> int:
+        return 1 << len(self.atoms)
+
+    def __iter__(self) -> typing.Iterator[tuple]:
+        # loop through all combinations of True/False atomic inputs
+        for vals in itertools.product(Logic.BIN_VALS.values(), repeat=len(self.atoms)):
+            yield self._row(vals)
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[tuple, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('truth table index out of range')
+        # rows count down from all True inputs, the first atom changing slowest
+        n = len(self.atoms)
+        return self._row(tuple(not index >> (n - 1 - i) & 1 for i in range(n)))
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, TruthTable):
+            return self.atoms == other.atoms and self.bits == other.bits
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
 # =============================================================================#
 
 
@@ -121,17 +381,26 @@ def simplify(new_terms: list) -> list:
 
 class WFF(object):
 
-    def __init__(self, data: typing.Union[str, list]) -> None:
+    def __init__(self, data: typing.Union[str, list, TruthTable]) -> None:
         """
         Initialize the WFF
         Generate an ast and collect the atoms
         """
 
+        if type(data) is list:
+            data = TruthTable.from_rows(data)
+
         if type(data) is str:
             self.statement = data
-        elif type(data) is list:
-            self._truth_table = data
-            self.statement = WFF(self.format()).statement
+        elif isinstance(data, TruthTable):
+            # format the table without an intermediate WFF
+            self.atoms = list(data.atoms)
+            self._tt_bits = data.bits
+            self._formatted = {}
+            self.statement = self.format()
+            # keep the packed rows if the statement kept the same atoms
+            if self.atoms == list(data.atoms):
+                self._tt_bits = data.bits
 
     def __setattr__(self, name: str, value: typing.Any) -> None:
         """
@@ -140,9 +409,33 @@ class WFF(object):
         self.__dict__[name] = value
         if name == 'statement':
             # re-parse if a new statement is given
-            self.ast, self.atoms = Lexer.parse(value)
-            # wipe the truth table
-            self._truth_table = None
+            self._set_ast(*_parse(value))
+
+    @classmethod
+    def _from_ast(cls, ast, atoms: list, statement: str) -> 'WFF':
+        """
+        Builds a WFF around an already parsed ast, skipping the lexer
+        (the statement should still describe the same function)
+        """
+        self = cls.__new__(cls)
+        self.__dict__['statement'] = statement
+        self._set_ast(ast, atoms)
+        return self
+
+    def _set_ast(self, ast, atoms: list) -> None:
+        """
+        Installs the ast of a new statement
+        """
+        self.ast = ast
+        self.atoms = list(atoms)
+        self._atom_set = frozenset(atoms)
+        # compiled on the first evaluation
+        self._compiled = None
+        # wipe the truth table and everything derived from it
+        self._truth_table = None
+        self._tt_bits = None
+        self._is_taut = self._is_contra = self._density = None
+        self._formatted = {}
 
     def __str__(self) -> str:
         return self.statement
@@ -153,70 +446,126 @@ class WFF(object):
         """
 
         # remove useless variables form the input dictionary
-        vals = {k: v for k, v in vals.items() if k in self.atoms}
+        vals = {k: v for k, v in vals.items() if k in self._atom_set}
 
         # If not all atoms are contained in given values, return a sub-truth_table
-        if [*vals] != self.atoms:
+        if len(vals) != len(self.atoms):
             return_list = []
             for row in self.truth_table:
                 if all([v == row[0][k] for k, v in vals.items()]):
                     return_list.append(row)
             return return_list
 
-        var_vals = vals.copy()
-
-        # Recursively evaluate the ast, substituting atoms with given values
-        def ast_eval(node) -> bool:
-            if isinstance(node, tuple):
-                return node[0](*[ast_eval(_node) for _node in node[1]])
-            elif node in Logic.BIN_VALS:
-                return Logic.BIN_VALS[node]
-            else:
-                return var_vals[node]
-
-        return ast_eval(self.ast)
+        if self._compiled is None:
+            self._compiled = _compile(self.statement, self.ast, self.atoms)
+        return self._compiled(*[vals[k] for k in self.atoms])
 
     @property
-    def truth_table(self) -> list:
+    def truth_table(self) -> TruthTable:
         """
         Returns the truth table if it has been generated
         otherwise generates one
         """
-        if self._truth_table != None:
-            return self._truth_table
-
-        self._truth_table = []
-        # loop through all combinations of True/False atomic inputs
-        for vals in itertools.product(Logic.BIN_VALS.values(), repeat=len(self.atoms)):
-            # assign the input values to an atomic input
-            p_vals = {k: v for (k, v) in zip(self.atoms, vals)}
-            # append the evaluation results with the inputs to the table
-            self._truth_table.append((p_vals, self(**p_vals)))
+        if self._truth_table is None:
+            self._truth_table = TruthTable(self.atoms, self._truth_bits)
         return self._truth_table
 
+    @property
+    def _truth_bits(self) -> int:
+        """
+        Returns the truth table packed into an integer whose bit k is the
+        evaluation of assignment k (atom i set to bit i of k)
+        """
+        if self._tt_bits is not None:
+            return self._tt_bits
+
+        self._tt_bits = self._eval_bits(self.atoms)
+        return self._tt_bits
+
+    def _bits_over(self, atoms: list) -> int:
+        """
+        Returns the packed truth table over the given atoms, which include
+        all of the WFF's atoms, reusing the WFF's own table when its atoms
+        lead the list
+        """
+        n = len(self.atoms)
+        if atoms[:n] == self.atoms:
+            return _repeat(self._truth_bits, n, len(atoms))
+        return self._eval_bits(atoms)
+
+    def _eval_bits(self, atoms: list) -> int:
+        """
+        Evaluates the WFF for every assignment of the given atoms at once
+        and returns the results packed as in _truth_bits
+        """
+        n = len(atoms)
+        return self._eval_columns(dict(zip(atoms, _columns(n))), (1 << (1 << n)) - 1)
+
+    def _corners(self) -> int:
+        """
+        Evaluates just the all False (bit 0) and all True (bit 1) inputs
+        """
+        return self._eval_columns(dict.fromkeys(self.atoms, 0b10), 0b11)
+
+    def _eval_columns(self, columns: dict, full: int) -> int:
+        """
+        Evaluates the WFF bitwise, with each atom's values given as a column
+        of bits and full as the column of all True values
+        """
+        # evaluate the ast, substituting atoms with their columns
+        bin_vals, bit_ops = Logic.BIN_VALS, BIT_OPS
+
+        def leaf(node) -> int:
+            if node in bin_vals:
+                return full if bin_vals[node] else 0
+            return columns[node]
+
+        return _fold(self.ast, leaf, lambda func, args: bit_ops[func](full, *args))
+
     def is_tautology(self) -> bool:
         """
         Return whether or not the statement is a tautology
         """
-        return all((_[1] for _ in self.truth_table))
+        if self._is_taut is None:
+            # before building a large table, see if a corner input is False
+            if self._tt_bits is None and len(self.atoms) > PROBE_ATOMS and self._corners() != 0b11:
+                self._is_taut = False
+            else:
+                self._is_taut = self._truth_bits == (1 << (1 << len(self.atoms))) - 1
+        return self._is_taut
 
     def is_contradiction(self) -> bool:
         """
         Return whether or not the statement is a contradiction
         """
-        return all((not _[1] for _ in self.truth_table))
+        if self._is_contra is None:
+            # before building a large table, see if a corner input is True
+            if self._tt_bits is None and len(self.atoms) > PROBE_ATOMS and self._corners() != 0:
+                self._is_contra = False
+            else:
+                self._is_contra = self._truth_bits == 0
+        return self._is_contra
 
     def density(self) -> float:
         """
         Return the percentage of True possible evaluations
         """
-        return sum([1 for _ in self.truth_table if _[1]]) / len(self.truth_table)
+        if self._density is None:
+            self._density = bin(self._truth_bits).count('1') / (1 << len(self.atoms))
+        return self._density
 
     def infer(self, wff) -> bool:
         """
         Returns whether or not the argument WFF can be inferred
         """
-        return WFF('({})>({})'.format(self, wff)).is_tautology()
+        # accept anything whose string is a statement, as derivative() does
+        wff = wff if isinstance(wff, WFF) else WFF(str(wff))
+        # line both truth tables up over all of their atoms, this WFF's first
+        atoms = self.atoms + [k for k in wff.atoms if k not in self._atom_set]
+        premise = self._bits_over(atoms)
+        conclusion = wff._bits_over(atoms)
+        # the inference holds unless some assignment is True then False
+        return premise & ~conclusion == 0
 
     def format(self, form='DNF') -> str:
         """
@@ -225,30 +574,38 @@ class WFF(object):
         # CNF (conjunctive normal form) (a+b)&(c+d)
         # DNF (disjunctive normal form) (a&b)+(c&d)
 
+        if form in self._formatted:
+            return self._formatted[form]
+
         FORM_D = {'DNF': True, 'CNF': False}
         SYMB_D = {'DNF': ('*', ')+('), 'CNF': ('+', ')*(')}
 
-        terms = []
-        # loop through the truth table grabbing atomic value combinations
-        for row in self.truth_table:
-            if row[1] == FORM_D[form]:
-
-                # copy the dictionary to the terms and swap the value if CNF
-                if form == 'CNF':
-                    terms.append({k: not v for k, v in row[0].items()})
-                else:
-                    terms.append({k: v for k, v in row[0].items()})
-
-        # reduce the terms by simplification
-        simplify(terms)
-
-        # convert the atom/value dictionary to a statement for each term
-        terms = [['~' + k if not t[k] else k for k in t] for t in terms]
-        # convert the individual terms to strings
-        statement_terms = [SYMB_D[form][0].join(m) for m in terms]
+        n = len(self.atoms)
+        bits = self._truth_bits
+        # constant statements have no terms to write out
+        if bits in (0, (1 << (1 << n)) - 1):
+            self._formatted[form] = '({})'.format(bool(bits))
+            return self._formatted[form]
+
+        # CNF terms cover the False rows, with each literal swapped
+        if not FORM_D[form]:
+            bits ^= (1 << (1 << n)) - 1
+
+        # the literals for each atom's value bit being False or True, once
+        if FORM_D[form]:
+            literals = [('~' + k, k) for k in self.atoms]
+        else:
+            literals = [(k, '~' + k) for k in self.atoms]
+
+        # reduce the rows to a minimal set of terms and convert the
+        # individual terms to strings
+        statement_terms = [SYMB_D[form][0].join([literals[i][values >> i & 1]
+                                                 for i in range(n) if mask >> i & 1])
+                           for mask, values in _minimize(bits, n)]
         # combine the individual terms into a full statement
         statement = '(' + SYMB_D[form][1].join(statement_terms) + ')'
 
+        self._formatted[form] = statement
         return statement
 
 # =============================================================================#
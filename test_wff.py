@@ -0,0 +1,38 @@
+import Wff
+
+
+def test_call_long_conjunction():
+    # the inlined lambda nests a level per operator, past what CPython compiles
+    assert Wff.WFF('&'.join('a' * 200))(a=True) is True
+    assert Wff.WFF('&'.join('a' * 200))(a=False) is False
+
+
+def test_call_long_derivative():
+    assert Wff.derivative([Wff.WFF('a>b')] * 200)(a=True, b=True) is True
+    assert Wff.derivative([Wff.WFF('a>b')] * 200)(a=True, b=False) is False
+
+
+def test_call_deep_nesting():
+    # nested past the recursion limit, so only the iterative walks can evaluate it
+    w = Wff.WFF('~(' * 1500 + 'a' + ')' * 1500 + '&b')
+    assert w(a=True, b=True) is True
+    assert w(a=False, b=True) is False
+    assert w.truth_table == [({'a': True, 'b': True}, True),
+                             ({'a': True, 'b': False}, False),
+                             ({'a': False, 'b': True}, False),
+                             ({'a': False, 'b': False}, False)]
+
+
+def test_infer_accepts_statements():
+    assert Wff.WFF('a').infer('a') is True
+    assert Wff.WFF('a').infer('b') is False
+    assert Wff.derivative([Wff.WFF('a>b'), Wff.WFF('a')]).infer('b') is True
+
+
+def test_derivative_call_skips_lexer(monkeypatch):
+    w = Wff.derivative([Wff.WFF('p>q'), Wff.WFF('p')])
+    parsed = []
+    parse = Wff.Lexer.parse
+    monkeypatch.setattr(Wff.Lexer, 'parse', lambda s: parsed.append(s) or parse(s))
+    assert w(p=True, q=True) is True
+    assert parsed == []